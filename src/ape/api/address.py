@@ -24,6 +24,12 @@ class BaseAddress(BaseInterface):
             bool: comparison result
         """
 
+        # NOTE: Addresses that match case-insensitively are equal, so skip
+        #  the checksum conversion of both sides in that (common) case.
+        other_address = other.address if isinstance(other, BaseAddress) else other
+        if isinstance(other_address, str) and other_address.lower() == self.address.lower():
+            return True
+
         convert = self.conversion_manager.convert
         return convert(self, AddressType) == convert(other, AddressType)
 
@@ -1,4 +1,5 @@
 import json
+import locale
 from pathlib import Path
 from typing import TYPE_CHECKING, Collection, Dict, List, Optional
 
@@ -122,17 +123,20 @@ class ProjectAPI(BaseInterfaceModel):
     def _create_source_dict(
         cls, contract_paths: Collection[Path], base_path: Path
     ) -> Dict[str, Source]:
-        return {
-            str(get_relative_path(source, base_path)): Source(  # type: ignore
+        source_dict: Dict[str, Source] = {}
+        for source in contract_paths:
+            # NOTE: Read each file once and use the same bytes for the checksum and content.
+            source_bytes = source.read_bytes()
+            source_dict[str(get_relative_path(source, base_path))] = Source(  # type: ignore
                 checksum=Checksum(  # type: ignore
                     algorithm="md5",
-                    hash=compute_checksum(source.read_bytes()),
+                    hash=compute_checksum(source_bytes),
                 ),
                 urls=[],
-                content=source.read_text(),
+                content=_decode_source(source_bytes),
             )
-            for source in contract_paths
-        }
+
+        return source_dict
 
 
 class DependencyAPI(BaseInterfaceModel):
@@ -245,12 +249,22 @@ class DependencyAPI(BaseInterfaceModel):
         return project_manifest
 
 
+def _decode_source(source_bytes: bytes) -> str:
+    # NOTE: Match ``Path.read_text()``: decode with the locale's preferred encoding
+    #  and translate newlines the same way text-mode reads do.
+    text = source_bytes.decode(locale.getpreferredencoding(False))
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
 def _load_manifest_from_file(file_path: Path) -> Optional[PackageManifest]:
-    if not file_path.exists():
+    # NOTE: Attempt the read directly rather than checking that the file exists first.
+    try:
+        manifest_text = file_path.read_text()
+    except FileNotFoundError:
         return None
 
     try:
-        manifest_dict = json.loads(file_path.read_text())
+        manifest_dict = json.loads(manifest_text)
         if not isinstance(manifest_dict, dict) or "manifest" not in manifest_dict:
             raise AssertionError()  # To reach except block
 
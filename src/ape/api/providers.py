@@ -8,7 +8,7 @@ from abc import ABC
 from pathlib import Path
 from signal import SIGINT, SIGTERM, signal
 from subprocess import PIPE, Popen, call
-from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from eth_abi.abi import encode_single
 from eth_typing import HexStr
@@ -604,16 +604,14 @@ class Web3Provider(ProviderAPI, ABC):
         stop_increment = block_page_size - 1
         stop = min(start + stop_increment, stop_block)
 
+        # NOTE: Pages only differ by block range, so build the filters once and re-use them.
+        log_filters = self._create_log_filters(address, abi, event_parameters=event_parameters)
+
         while start <= stop_block:
             logs = [
                 log
                 for log in self._get_logs_in_block_range(
-                    address,
-                    abi,
-                    start_block=start,
-                    stop_block=stop,
-                    block_page_size=block_page_size,
-                    event_parameters=event_parameters,
+                    log_filters, start_block=start, stop_block=stop
                 )
             ]
 
@@ -635,39 +633,27 @@ class Web3Provider(ProviderAPI, ABC):
             start = stop + 1
             stop = min(start + stop_increment, stop_block)
 
-    def _get_logs_in_block_range(
+    def _create_log_filters(
         self,
         address: Union[AddressType, List[AddressType]],
         abi: Union[List[EventABI], EventABI],
-        start_block: Optional[int] = None,
-        stop_block: Optional[int] = None,
-        block_page_size: Optional[int] = None,
         event_parameters: Optional[Dict] = None,
-    ):
-        start_block = start_block or 0
+    ) -> List[Tuple[EventABI, Dict]]:
         abis = abi if isinstance(abi, (list, tuple)) else [abi]
-        block_page_size = block_page_size or 100
-        stop_block = start_block + block_page_size if stop_block is None else stop_block
+        addresses = address if isinstance(address, (list, tuple)) else [address]
+        addresses = [self.conversion_manager.convert(a, AddressType) for a in addresses]
         event_parameters = event_parameters or {}
-        for abi in abis:
-            if not isinstance(address, (list, tuple)):
-                address = [address]
-
-            addresses = [self.conversion_manager.convert(a, AddressType) for a in address]
-            log_filter: Dict = {
-                "address": addresses,
-                "fromBlock": start_block,
-                "toBlock": stop_block,
-                "topics": [],
-            }
+        log_filters = []
+        for event_abi in abis:
+            log_filter: Dict = {"address": addresses, "topics": []}
 
             if "topics" not in event_parameters:
-                event_signature_hash = add_0x_prefix(HexStr(keccak(text=abi.selector).hex()))
+                event_signature_hash = add_0x_prefix(HexStr(keccak(text=event_abi.selector).hex()))
                 log_filter["topics"] = [event_signature_hash]
                 search_topics = []
                 abi_types = []
                 topics = LogInputABICollection(
-                    abi, [abi_input for abi_input in abi.inputs if abi_input.indexed]
+                    event_abi, [abi_input for abi_input in event_abi.inputs if abi_input.indexed]
                 )
 
                 for name, arg in event_parameters.items():
@@ -681,7 +667,7 @@ class Web3Provider(ProviderAPI, ABC):
 
                     if not abi_type:
                         raise DecodingError(
-                            f"'{name}' is not an indexed topic for event '{abi.name}'."
+                            f"'{name}' is not an indexed topic for event '{event_abi.name}'."
                         )
 
                     search_topics.append(arg)
@@ -693,9 +679,21 @@ class Web3Provider(ProviderAPI, ABC):
                 ]
                 log_filter["topics"].extend(encoded_topic_data)
             else:
-                log_filter["topics"] = event_parameters.pop("topics")
+                log_filter["topics"] = event_parameters["topics"]
+
+            log_filters.append((event_abi, log_filter))
+
+        return log_filters
 
-            log_result = [dict(log) for log in self.web3.eth.get_logs(log_filter)]  # type: ignore
+    def _get_logs_in_block_range(
+        self,
+        log_filters: List[Tuple[EventABI, Dict]],
+        start_block: int,
+        stop_block: int,
+    ) -> Iterator[ContractLog]:
+        for abi, log_filter in log_filters:
+            page_filter = {**log_filter, "fromBlock": start_block, "toBlock": stop_block}
+            log_result = [dict(log) for log in self.web3.eth.get_logs(page_filter)]  # type: ignore
             yield from self.network.ecosystem.decode_logs(abi, log_result)
 
     def send_transaction(self, txn: TransactionAPI) -> ReceiptAPI:
@@ -19,16 +19,17 @@ if TYPE_CHECKING:
 
 def _convert_kwargs(kwargs, converter) -> Dict:
     fields = TransactionAPI.__fields__
-    kwargs_to_convert = {k: v for k, v in kwargs.items() if k == "sender" or k in fields}
-    converted_fields = {
-        k: converter(
-            v,
+    converted_kwargs = {}
+    for key, value in kwargs.items():
+        if key == "sender":
             # TODO: Upstream, `TransactionAPI.sender` should be `AddressType` (not `str`)
-            AddressType if k == "sender" else fields[k].type_,
-        )
-        for k, v in kwargs_to_convert.items()
-    }
-    return {**kwargs, **converted_fields}
+            value = converter(value, AddressType)
+        elif key in fields:
+            value = converter(value, fields[key].type_)
+
+        converted_kwargs[key] = value
+
+    return converted_kwargs
 
 
 class ContractConstructor(ManagerAccessMixin):
@@ -81,10 +82,14 @@ class ContractCall(ManagerAccessMixin):
 
     def __call__(self, *args, **kwargs) -> Any:
         txn = self.serialize_transaction(*args, **kwargs)
-        txn.chain_id = self.provider.network.chain_id
 
-        raw_output = self.provider.send_call(txn)
-        output = self.provider.network.ecosystem.decode_returndata(
+        # NOTE: Resolve the active provider and network once for the whole call.
+        provider = self.provider
+        network = provider.network
+        txn.chain_id = network.chain_id
+
+        raw_output = provider.send_call(txn)
+        output = network.ecosystem.decode_returndata(
             self.abi,
             raw_output,
         )
@@ -113,15 +118,12 @@ class ContractCallHandler(ManagerAccessMixin):
         abis = sorted(self.abis, key=lambda abi: len(abi.inputs or []))
         return abis[-1].signature
 
-    def _convert_tuple(self, v: tuple) -> tuple:
-        return self.conversion_manager.convert(v, tuple)
-
     def __call__(self, *args, **kwargs) -> Any:
         if not self.contract.is_contract:
             network = self.provider.network.name
             raise _get_non_contract_error(self.contract.address, network)
 
-        args = self._convert_tuple(args)
+        args = self.conversion_manager.convert(args, tuple)
         selected_abi = _select_method_abi(self.abis, args)
 
         return ContractCall(  # type: ignore
@@ -184,15 +186,12 @@ class ContractTransactionHandler(ManagerAccessMixin):
         abis = sorted(self.abis, key=lambda abi: len(abi.inputs or []))
         return abis[-1].signature
 
-    def _convert_tuple(self, v: tuple) -> tuple:
-        return self.conversion_manager.convert(v, tuple)
-
     def __call__(self, *args, **kwargs) -> ReceiptAPI:
         if not self.contract.is_contract:
             network = self.provider.network.name
             raise _get_non_contract_error(self.contract.address, network)
 
-        args = self._convert_tuple(args)
+        args = self.conversion_manager.convert(args, tuple)
         selected_abi = _select_method_abi(self.abis, args)
 
         return ContractTransaction(  # type: ignore
@@ -537,35 +536,30 @@ class ContractInstance(BaseAddress):
             Any: The return value from the contract call, or a transaction receipt.
         """
 
-        if attr_name in set(super(BaseAddress, self).__dir__()):
+        # NOTE: Same membership as ``object.__dir__()`` without building the full listing.
+        #  Only check the class namespaces (not ``hasattr``), which would also find
+        #  metaclass attributes such as ``ABCMeta.register``.
+        if attr_name in self.__dict__ or any(attr_name in vars(c) for c in type(self).__mro__):
             return super(BaseAddress, self).__getattribute__(attr_name)
 
-        if attr_name not in {*self._view_methods_, *self._mutable_methods_, *self._events_}:
+        handler_maps: Tuple[Dict[str, Any], ...] = (
+            self._view_methods_,
+            self._mutable_methods_,
+            self._events_,
+        )
+        handlers = [h[attr_name] for h in handler_maps if attr_name in h]
+        if not handlers:
             # Didn't find anything that matches
             # NOTE: `__getattr__` *must* raise `AttributeError`
             name = self._contract_type.name or self.__class__.__name__
             raise AttributeError(f"'{name}' has no attribute '{attr_name}'.")
 
-        elif (
-            int(attr_name in self._view_methods_)
-            + int(attr_name in self._mutable_methods_)
-            + int(attr_name in self._events_)
-            > 1
-        ):
+        elif len(handlers) > 1:
             # ABI should not contain a mix of events, mutable and view methods that match
             # NOTE: `__getattr__` *must* raise `AttributeError`
             raise AttributeError(f"{self.__class__.__name__} has corrupted ABI.")
 
-        if attr_name in self._view_methods_:
-            handler = self._view_methods_[attr_name]
-
-        elif attr_name in self._mutable_methods_:
-            handler = self._mutable_methods_[attr_name]  # type: ignore
-
-        else:
-            handler = self._events_[attr_name]  # type: ignore
-
-        return handler
+        return handlers[0]
 
 
 class ContractContainer(ManagerAccessMixin):
@@ -636,8 +630,9 @@ class ContractContainer(ManagerAccessMixin):
             receipt = kwargs["sender"].call(txn)
 
         else:
-            txn = self.provider.prepare_transaction(txn)
-            receipt = self.provider.send_transaction(txn)
+            provider = self.provider
+            txn = provider.prepare_transaction(txn)
+            receipt = provider.send_transaction(txn)
 
         if not receipt.contract_address:
             raise ContractError(f"'{receipt.txn_hash}' did not create a contract.")
@@ -676,10 +671,8 @@ def _Contract(
     #    contract_type = network.contract_cache[address]
 
     # Check explorer API/cache (e.g. publicly published contracts)
-    # TODO: Store in ``NetworkAPI.contract_cache`` to reduce API calls
-    explorer = provider.network.explorer
-    if not contract_type and explorer:
-        contract_type = explorer.get_contract_type(converted_address)
+    if not contract_type:
+        contract_type = networks.chain_manager.get_contract_type(converted_address)
 
     # We have a contract type either:
     #   1) explicitly provided,
@@ -722,10 +715,15 @@ class ContractNamespace:
 
     """
 
+    __slots__ = ("name", "contracts", "_prefix")
+
     def __init__(self, name: str, contracts: List[ContractContainer]):
         self.name = name
         self.contracts = contracts
 
+        # NOTE: The namespace prefix of every contract name in this namespace.
+        self._prefix = f"{name}."
+
     def __repr__(self) -> str:
         return f"<{self.name}>"
 
@@ -747,7 +745,7 @@ class ContractNamespace:
         for contract in self.contracts:
             search_contract_name = _get_name(contract)
             search_name = (
-                search_contract_name.replace(f"{self.name}.", "") if search_contract_name else None
+                search_contract_name.replace(self._prefix, "") if search_contract_name else None
             )
             if not search_name:
                 continue
@@ -760,7 +758,7 @@ class ContractNamespace:
                 if next_node != item:
                     continue
 
-                subname = f"{self.name}.{next_node}"
+                subname = f"{self._prefix}{next_node}"
                 subcontracts = [c for c in self.contracts if _get_name(c).startswith(subname)]
                 return ContractNamespace(subname, subcontracts)
 
@@ -256,6 +256,7 @@ class SubprocessTimeoutError(SubprocessError):
         self._seconds = seconds
         self._exception = exception
         self._start_time = None
+        self._expire_at_monotonic: Optional[float] = None
         self._is_running = None
 
     def __enter__(self):
@@ -285,6 +286,12 @@ class SubprocessTimeoutError(SubprocessError):
             raise ValueError("Timeout has already been started.")
 
         self._start_time = time.time()
+
+        # NOTE: Check against the monotonic clock so wall-clock adjustments cannot skew
+        #  the timeout. ``expire_at`` stays an epoch timestamp.
+        if self._seconds is not None:
+            self._expire_at_monotonic = time.monotonic() + self._seconds
+
         self._is_running = True
 
     def check(self):
@@ -294,10 +301,10 @@ class SubprocessTimeoutError(SubprocessError):
         elif self._is_running is False:
             raise ValueError("Timeout has already been cancelled.")
 
-        elif self._seconds is None:
+        elif self._expire_at_monotonic is None:  # No timeout given
             return
 
-        elif time.time() > self.expire_at:
+        elif time.monotonic() > self._expire_at_monotonic:
             self.cancel()
             self._is_running = False
 
@@ -1,7 +1,8 @@
 import time
-from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import pandas as pd
+from ethpm_types import ContractType
 
 from ape.api import BlockAPI, ReceiptAPI
 from ape.api.address import BaseAddress
@@ -274,6 +275,7 @@ class AccountHistory(BaseManager):
     """
 
     _map: Dict[AddressType, List[ReceiptAPI]] = {}
+    _txn_hash_map: Dict[AddressType, Set[str]] = {}
 
     @cached_property
     def _convert(self) -> Callable:
@@ -294,12 +296,11 @@ class AccountHistory(BaseManager):
 
         address_key: AddressType = self._convert(address, AddressType)
         explorer = self.provider.network.explorer
-        explorer_receipts = (
-            [r for r in explorer.get_account_transactions(address_key)] if explorer else []
-        )
-        for receipt in explorer_receipts:
-            if receipt.txn_hash not in [r.txn_hash for r in self._map.get(address_key, [])]:
-                self.append(receipt)
+        if explorer:
+            # NOTE: Check the hash index rather than re-scanning the known receipts.
+            for receipt in explorer.get_account_transactions(address_key):
+                if receipt.txn_hash not in self._txn_hash_map.get(address_key, set()):
+                    self.append(receipt)
 
         return self._map.get(address_key, [])
 
@@ -338,12 +339,15 @@ class AccountHistory(BaseManager):
         address = self._convert(txn_receipt.sender, AddressType)
         if address not in self._map:
             self._map[address] = [txn_receipt]
+            self._txn_hash_map[address] = {txn_receipt.txn_hash}
             return
 
-        if txn_receipt.txn_hash in [r.txn_hash for r in self._map[address]]:
+        # NOTE: Check the hash index rather than scanning every known receipt.
+        if txn_receipt.txn_hash in self._txn_hash_map[address]:
             raise ChainError(f"Transaction '{txn_receipt.txn_hash}' already known.")
 
         self._map[address].append(txn_receipt)
+        self._txn_hash_map[address].add(txn_receipt.txn_hash)
 
     def revert_to_block(self, block_number: int):
         """
@@ -357,6 +361,7 @@ class AccountHistory(BaseManager):
             a: [r for r in receipts if r.block_number <= block_number]
             for a, receipts in self.items()
         }
+        self._txn_hash_map = {a: {r.txn_hash for r in receipts} for a, receipts in self.items()}
 
 
 class ChainManager(BaseManager):
@@ -374,28 +379,30 @@ class ChainManager(BaseManager):
     _chain_id_map: Dict[str, int] = {}
     _block_container_map: Dict[int, BlockContainer] = {}
     _account_history_map: Dict[int, AccountHistory] = {}
+    _explorer_contract_types: Dict[Tuple[str, str], Dict[AddressType, ContractType]] = {}
 
     @property
     def blocks(self) -> BlockContainer:
         """
         The list of blocks on the chain.
         """
-        if self.chain_id not in self._block_container_map:
-            blocks = BlockContainer()
-            self._block_container_map[self.chain_id] = blocks
+        # NOTE: Resolve the chain ID once; each access goes through the active provider.
+        chain_id = self.chain_id
+        if chain_id not in self._block_container_map:
+            self._block_container_map[chain_id] = BlockContainer()
 
-        return self._block_container_map[self.chain_id]
+        return self._block_container_map[chain_id]
 
     @property
     def account_history(self) -> AccountHistory:
         """
         A mapping of transactions from the active session to the account responsible.
         """
-        if self.chain_id not in self._account_history_map:
-            history = AccountHistory()
-            self._account_history_map[self.chain_id] = history
+        chain_id = self.chain_id
+        if chain_id not in self._account_history_map:
+            self._account_history_map[chain_id] = AccountHistory()
 
-        return self._account_history_map[self.chain_id]
+        return self._account_history_map[chain_id]
 
     @property
     def chain_id(self) -> int:
@@ -404,12 +411,42 @@ class ChainManager(BaseManager):
         See `ChainList <https://chainlist.org/>`__ for a comprehensive list of IDs.
         """
 
-        network_name = self.provider.network.name
+        provider = self.provider
+        network_name = provider.network.name
         if network_name not in self._chain_id_map:
-            self._chain_id_map[network_name] = self.provider.chain_id
+            self._chain_id_map[network_name] = provider.chain_id
 
         return self._chain_id_map[network_name]
 
+    def get_contract_type(self, address: AddressType) -> Optional[ContractType]:
+        """
+        Get the contract type published at the given address from the active
+        network's explorer. Found contract types are cached per network for the
+        rest of the session, so the explorer is only queried once per address.
+
+        Args:
+            address (``AddressType``): The address of the contract.
+
+        Returns:
+            Optional[``ContractType``]: The contract type, or ``None`` if the network
+            has no explorer or the explorer does not know the contract.
+        """
+
+        network = self.provider.network
+        explorer = network.explorer
+        if not explorer:
+            return None
+
+        network_key = (network.ecosystem.name, network.name)
+        contract_types = self._explorer_contract_types.setdefault(network_key, {})
+        contract_type = contract_types.get(address)
+        if contract_type is None:
+            contract_type = explorer.get_contract_type(address)
+            if contract_type:
+                contract_types[address] = contract_type
+
+        return contract_type
+
     @property
     def gas_price(self) -> int:
         """
@@ -48,8 +48,9 @@ class CompilerManager(BaseManager):
         """
 
         cache_key = self.config_manager.PROJECT_FOLDER
-        if cache_key in self._registered_compilers_cache:
-            return self._registered_compilers_cache[cache_key]
+        cached_compilers = self._registered_compilers_cache.get(cache_key)
+        if cached_compilers is not None:
+            return cached_compilers
 
         registered_compilers = {}
 
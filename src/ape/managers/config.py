@@ -231,11 +231,12 @@ class ConfigManager(BaseInterfaceModel):
 
         self.load()  # Only loads if it needs to.
 
-        if plugin_name not in self._plugin_configs:
+        plugin_config = self._plugin_configs.get(plugin_name)
+        if plugin_config is None:
             # plugin has no registered config class, so return empty config
             return PluginConfig()
 
-        return self._plugin_configs[plugin_name]
+        return plugin_config
 
     @contextmanager
     def using_project(
@@ -142,10 +142,11 @@ class NetworkManager(BaseManager):
         Returns:
             :class:`~ape.api.networks.EcosystemAPI`
         """
-        if ecosystem_name not in self.ecosystems:
+        ecosystems = self.ecosystems
+        if ecosystem_name not in ecosystems:
             raise NetworkError(f"Unknown ecosystem '{ecosystem_name}'.")
 
-        return self.ecosystems[ecosystem_name]
+        return ecosystems[ecosystem_name]
 
     def __getattr__(self, attr_name: str) -> EcosystemAPI:
         """
@@ -162,10 +163,11 @@ class NetworkManager(BaseManager):
             eth = networks.ethereum
         """
 
-        if attr_name not in self.ecosystems:
+        ecosystems = self.ecosystems
+        if attr_name not in ecosystems:
             raise AttributeError(f"{self.__class__.__name__} has no attribute '{attr_name}'.")
 
-        return self.ecosystems[attr_name]
+        return ecosystems[attr_name]
 
     def get_network_choices(
         self,
@@ -266,10 +268,12 @@ class NetworkManager(BaseManager):
             :class:`~ape.api.networks.EcosystemAPI`
         """
 
-        if ecosystem_name not in self.ecosystem_names:
+        # NOTE: Check the cached ecosystems rather than re-collecting names from the plugins.
+        ecosystems = self.ecosystems
+        if ecosystem_name not in ecosystems:
             raise NetworkError(f"Ecosystem '{ecosystem_name}' not found.")
 
-        return self.ecosystems[ecosystem_name]
+        return ecosystems[ecosystem_name]
 
     def get_provider_from_choice(
         self,
@@ -78,9 +78,10 @@ class GithubDependency(DependencyAPI):
         return f"<{self.__class__.__name__} github={self.github}>"
 
     def extract_manifest(self) -> PackageManifest:
-        if self.cached_manifest:
+        cached_manifest = self.cached_manifest
+        if cached_manifest:
             # Already downloaded
-            return self.cached_manifest
+            return cached_manifest
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_project_path = (Path(temp_dir) / self.name).resolve()
@@ -1,3 +1,4 @@
+import re
 import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Type, Union
@@ -9,6 +10,7 @@ from ape.contracts import ContractContainer, ContractNamespace
 from ape.exceptions import ProjectError
 from ape.managers.base import BaseManager
 from ape.managers.project.types import ApeProject, BrownieProject
+from ape.utils import get_all_files_in_directory
 
 
 class ProjectManager(BaseManager):
@@ -78,13 +80,13 @@ class ProjectManager(BaseManager):
             List[pathlib.Path]: A list of a source file paths in the project.
         """
         files: List[Path] = []
-        if not self.contracts_folder.exists():
+        extensions = [re.escape(e) for e in self.compiler_manager.registered_compilers]
+        if not extensions or not self.contracts_folder.exists():
             return files
 
-        for extension in self.compiler_manager.registered_compilers:
-            files.extend(self.contracts_folder.rglob(f"*{extension}"))
-
-        return files
+        # NOTE: Walk the contracts folder once, matching files ending in any registered extension.
+        pattern = rf".*({'|'.join(extensions)})$"
+        return get_all_files_in_directory(self.contracts_folder, pattern=pattern)
 
     @property
     def sources_missing(self) -> bool:
@@ -175,12 +177,14 @@ class ProjectManager(BaseManager):
 
     @property
     def _project(self) -> ProjectAPI:
-        if self.path.name not in self._cached_projects:
-            self._cached_projects[self.path.name] = self.get_project(
-                self.path, self.contracts_folder
-            )
+        # NOTE: Probe the cache once; only resolve the project on a miss.
+        path = self.path
+        project = self._cached_projects.get(path.name)
+        if project is None:
+            project = self.get_project(path, self.contracts_folder)
+            self._cached_projects[path.name] = project
 
-        return self._cached_projects[self.path.name]
+        return project
 
     def get_project(
         self,
@@ -274,14 +278,13 @@ class ProjectManager(BaseManager):
 
         if not contract:
             # Check if using namespacing.
+            # NOTE: Load the project's contracts once for the whole namespace
+            #  rather than once per matching contract type.
+            contracts = self.contracts
             namespaced_contracts = [
-                ct
-                for ct in [
-                    self._get_contract(ct.name)
-                    for n, ct in self.contracts.items()
-                    if ct.name and n.split(".")[0] == attr_name
-                ]
-                if ct
+                self.create_contract_container(contract_type=contracts[ct.name])
+                for n, ct in contracts.items()
+                if ct.name and n.split(".")[0] == attr_name and ct.name in contracts
             ]
             if namespaced_contracts:
                 return ContractNamespace(attr_name, namespaced_contracts)
@@ -423,25 +426,28 @@ class ProjectManager(BaseManager):
         return manifest.contract_types or {}
 
     def _load_dependencies(self) -> Dict[str, Dict[str, DependencyAPI]]:
-        if self.path.name not in self._cached_dependencies:
-            dependencies: Dict[str, Dict[str, DependencyAPI]] = {}
-            for dependency_config in self.config_manager.dependencies:
-                dependency_config.extract_manifest()
-                version_id = dependency_config.version_id
-                if dependency_config.name in dependencies:
-                    dependencies[dependency_config.name][version_id] = dependency_config
-                else:
-                    dependencies[dependency_config.name] = {version_id: dependency_config}
-
-            self._cached_dependencies[self.path.name] = dependencies
-
-        return self._cached_dependencies[self.path.name]
+        project_name = self.path.name
+        cached_dependencies = self._cached_dependencies.get(project_name)
+        if cached_dependencies is not None:
+            return cached_dependencies
+
+        dependencies: Dict[str, Dict[str, DependencyAPI]] = {}
+        for dependency_config in self.config_manager.dependencies:
+            dependency_config.extract_manifest()
+            version_id = dependency_config.version_id
+            if dependency_config.name in dependencies:
+                dependencies[dependency_config.name][version_id] = dependency_config
+            else:
+                dependencies[dependency_config.name] = {version_id: dependency_config}
+
+        self._cached_dependencies[project_name] = dependencies
+        return dependencies
 
     def _get_contract(self, name: str) -> Optional[ContractContainer]:
-        if name in self.contracts:
-            return self.create_contract_container(
-                contract_type=self.contracts[name],
-            )
+        # NOTE: ``self.contracts`` loads the project, so only access it once.
+        contract_type = self.contracts.get(name)
+        if contract_type is not None:
+            return self.create_contract_container(contract_type=contract_type)
 
         return None
 
@@ -1,4 +1,5 @@
 import json
+import re
 from pathlib import Path
 from typing import List, Optional
 
@@ -42,16 +43,13 @@ class BaseProject(ProjectAPI):
         """
         files: List[Path] = []
 
-        if not self.contracts_folder.exists():
+        extensions = [re.escape(e) for e in self.compiler_manager.registered_compilers]
+        if not extensions or not self.contracts_folder.exists():
             return files
 
-        for extension in self.compiler_manager.registered_compilers:
-            r_ext = extension.replace(".", "\\.")
-            files.extend(
-                get_all_files_in_directory(self.contracts_folder, pattern=rf"[\w|-]+{r_ext}")
-            )
-
-        return files
+        # NOTE: Walk the contracts folder once, matching any of the registered extensions.
+        pattern = rf"[\w|-]+({'|'.join(extensions)})"
+        return get_all_files_in_directory(self.contracts_folder, pattern=pattern)
 
     def configure(self, **kwargs):
         # Don't override existing config file.
@@ -80,8 +78,11 @@ class BaseProject(ProjectAPI):
             self.configure()
 
             # Load a cached or clean manifest (to use for caching)
-            if self.cached_manifest and use_cache:
-                manifest = self.cached_manifest
+            # NOTE: Check 'use_cache' first so a forced re-compile never parses the cache file.
+            #  Only load the cache file once; each access re-reads and validates it.
+            cached_manifest = self.cached_manifest if use_cache else None
+            if cached_manifest:
+                manifest = cached_manifest
             else:
                 manifest = PackageManifest()
 
@@ -152,8 +153,16 @@ class BaseProject(ProjectAPI):
                     initial_manifest=manifest,
                 )
 
-                # Cache the updated manifest so `self.cached_manifest` reads it next time
-                self.manifest_cachefile.write_text(json.dumps(manifest.dict()))
+                # Cache the updated manifest so `self.cached_manifest` reads it next time.
+                # NOTE: Only re-write the file when something was compiled or the set of
+                #  sources changed; otherwise the cached file is already up-to-date.
+                if (
+                    needs_compiling
+                    or (manifest.sources or {}).keys() != cached_sources.keys()
+                    or not self.manifest_cachefile.exists()
+                ):
+                    self.manifest_cachefile.write_text(json.dumps(manifest.dict()))
+
                 return manifest
 
         finally:
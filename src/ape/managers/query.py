@@ -8,7 +8,7 @@ from ape.api import QueryAPI, QueryType
 from ape.api.query import BlockQuery, _BaseQuery
 from ape.exceptions import QueryEngineError
 from ape.plugins import clean_plugin_name
-from ape.utils import ManagerAccessMixin, cached_property, singledispatchmethod
+from ape.utils import ManagerAccessMixin, cached_property
 
 
 def get_columns_from_item(query: _BaseQuery, item: BaseModel) -> Dict[str, Any]:
@@ -21,21 +21,24 @@ class DefaultQueryProvider(QueryAPI):
     Allows for the query of blockchain data using connected provider
     """
 
-    @singledispatchmethod
-    def estimate_query(self, query: QueryType) -> Optional[int]:  # type: ignore
+    # NOTE: Only ``BlockQuery`` is supported, so a plain ``isinstance`` check is
+    #  cheaper than going through ``singledispatchmethod`` on every query.
+    def estimate_query(self, query: QueryType) -> Optional[int]:
+        if isinstance(query, BlockQuery):
+            return self.estimate_block_query(query)
 
         return None  # can't handle this query
 
-    @estimate_query.register
     def estimate_block_query(self, query: BlockQuery) -> Optional[int]:
         # NOTE: Very loose estimate of 100ms per block
         return (query.stop_block - query.start_block) * 100
 
-    @singledispatchmethod
-    def perform_query(self, query: QueryType) -> pd.DataFrame:  # type: ignore
+    def perform_query(self, query: QueryType) -> pd.DataFrame:
+        if isinstance(query, BlockQuery):
+            return self.perform_block_query(query)
+
         raise QueryEngineError(f"Cannot handle '{type(query)}'.")
 
-    @perform_query.register
     def perform_block_query(self, query: BlockQuery) -> pd.DataFrame:
         blocks_iter = map(
             self.provider.get_block,
@@ -137,26 +137,13 @@ class BaseInterfaceModel(BaseInterface, BaseModel):
         return [member for member in super().__dir__() if not member.startswith("_")]
 
     def dict(self, *args, **kwargs) -> Dict:
-        if "by_alias" not in kwargs:
-            kwargs["by_alias"] = True
-
-        if "exclude_none" not in kwargs:
-            kwargs["exclude_none"] = True
-
+        kwargs.setdefault("by_alias", True)
+        kwargs.setdefault("exclude_none", True)
         return super().dict(*args, **kwargs)
 
     def json(self, *args, **kwargs) -> str:
-
-        if "separators" not in kwargs:
-            kwargs["separators"] = (",", ":")
-
-        if "sort_keys" not in kwargs:
-            kwargs["sort_keys"] = True
-
-        if "by_alias" not in kwargs:
-            kwargs["by_alias"] = True
-
-        if "exclude_none" not in kwargs:
-            kwargs["exclude_none"] = True
-
+        kwargs.setdefault("separators", (",", ":"))
+        kwargs.setdefault("sort_keys", True)
+        kwargs.setdefault("by_alias", True)
+        kwargs.setdefault("exclude_none", True)
         return super().json(*args, **kwargs)
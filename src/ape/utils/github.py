@@ -5,7 +5,7 @@ import tempfile
 import zipfile
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
 import pygit2  # type: ignore
 from github import Github, UnknownObjectException
@@ -27,6 +27,7 @@ class GithubClient:
 
     TOKEN_KEY = "GITHUB_ACCESS_TOKEN"
     _repo_cache: Dict[str, GithubRepository] = {}
+    _release_cache: Dict[Tuple[str, str], GitRelease] = {}
 
     def __init__(self):
         token = os.environ[self.TOKEN_KEY] if self.TOKEN_KEY in os.environ else None
@@ -66,7 +67,7 @@ class GithubClient:
         Returns:
             github.GitRelease.GitRelease
         """
-        repo = self._client.get_repo(repo_path)
+        repo = self.get_repo(repo_path)
 
         if version == "latest":
             return repo.get_latest_release()
@@ -74,11 +75,20 @@ class GithubClient:
         if not version.startswith("v"):
             version = f"v{version}"
 
+        # NOTE: A tagged release does not change, so only request it once per session.
+        #  ``"latest"`` is not cached since it moves with each new release.
+        cache_key = (repo_path, version)
+        if cache_key in self._release_cache:
+            return self._release_cache[cache_key]
+
         try:
-            return repo.get_release(version)
+            release = repo.get_release(version)
         except UnknownObjectException:
             raise ProjectError(f"Unknown version '{version.lstrip('v')}' for repo '{repo.name}'.")
 
+        self._release_cache[cache_key] = release
+        return release
+
     def get_repo(self, repo_path: str) -> GithubRepository:
         """
         Get a repository from GitHub.
@@ -358,7 +358,14 @@ class Ethereum(EcosystemAPI):
         abi_topics = LogInputABICollection(abi, topics_list)
         abi_data = LogInputABICollection(abi, data_list)
 
-        duplicate_names = set(abi_topics.names).intersection(abi_data.names)
+        # NOTE: These are computed properties (they re-parse the ABI types),
+        #  so resolve them once per event rather than once per log.
+        topic_names = abi_topics.names
+        topic_types = abi_topics.types
+        data_names = abi_data.names
+        data_types = abi_data.types
+
+        duplicate_names = set(topic_names).intersection(data_names)
         if duplicate_names:
             duplicate_names_str = ", ".join([n for n in duplicate_names if n])
             raise DecodingError(
@@ -370,20 +377,20 @@ class Ethereum(EcosystemAPI):
             indexed_data = log["topics"] if log.get("anonymous", False) else log["topics"][1:]
             log_data = hexstr_if_str(to_bytes, log["data"])  # type: ignore
 
-            if len(indexed_data) != len(abi_topics.types):
+            if len(indexed_data) != len(topic_types):
                 raise DecodingError(
-                    f"Expected '{len(indexed_data)}' log topics.  Got '{len(abi_topics.types)}'."
+                    f"Expected '{len(indexed_data)}' log topics.  Got '{len(topic_types)}'."
                 )
 
             decoded_topic_data = [
                 decode_single(topic_type, topic_data)  # type: ignore
-                for topic_type, topic_data in zip(abi_topics.types, indexed_data)
+                for topic_type, topic_data in zip(topic_types, indexed_data)
             ]
-            decoded_log_data = decode_abi(abi_data.types, log_data)  # type: ignore
+            decoded_log_data = decode_abi(data_types, log_data)  # type: ignore
             event_args = dict(
                 itertools.chain(
-                    zip(abi_topics.names, decoded_topic_data),
-                    zip(abi_data.names, decoded_log_data),
+                    zip(topic_names, decoded_topic_data),
+                    zip(data_names, decoded_log_data),
                 )
             )
             yield ContractLog(  # type: ignore
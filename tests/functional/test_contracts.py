@@ -2,11 +2,14 @@ import re
 from typing import Optional
 
 import pytest
-from eth_utils import is_checksum_address
+from eth_utils import is_checksum_address, keccak
+from ethpm_types import ContractType
 from hexbytes import HexBytes
 
 from ape import Contract
 from ape.api import Address, ReceiptAPI
+from ape.contracts import ContractInstance
+from ape.contracts.base import ContractTransactionHandler
 from ape.exceptions import DecodingError
 from ape.types import ContractLog
 
@@ -21,6 +24,28 @@ def test_init_at_unknown_address():
     assert contract.address == SOLIDITY_CONTRACT_ADDRESS
 
 
+def test_init_from_explorer_is_cached(
+    mocker, chain, vyper_contract_type, networks_connected_to_tester
+):
+    explorer = mocker.MagicMock()
+    explorer.get_contract_type.return_value = vyper_contract_type
+    network = chain.provider.network
+    mocker.patch.object(
+        type(network), "explorer", new_callable=mocker.PropertyMock, return_value=explorer
+    )
+
+    try:
+        first = Contract(VYPER_CONTRACT_ADDRESS)
+        second = Contract(VYPER_CONTRACT_ADDRESS)
+    finally:
+        chain._explorer_contract_types.clear()  # Undo
+
+    assert isinstance(first, ContractInstance)
+    assert isinstance(second, ContractInstance)
+    assert second._contract_type == vyper_contract_type
+    explorer.get_contract_type.assert_called_once_with(VYPER_CONTRACT_ADDRESS)
+
+
 def test_deploy(sender, contract_container, networks_connected_to_tester):
     contract = contract_container.deploy(sender=sender, something_else="IGNORED")
     assert contract.address in (SOLIDITY_CONTRACT_ADDRESS, VYPER_CONTRACT_ADDRESS)
@@ -167,6 +192,38 @@ def test_contract_logs_range_with_paging(contract_instance, owner, chain):
     assert_log_values(logs[3], 100, previous_number=3)
 
 
+def test_contract_logs_range_with_paging_and_topics(
+    contract_instance, owner, chain, eth_tester_provider, mocker
+):
+    # Create 1 log each in the first 3 blocks.
+    for i in range(3):
+        contract_instance.setNumber(i + 1, sender=owner)
+
+    abi = contract_instance.NumberChange.abi
+    topics = [HexBytes(keccak(text=abi.selector)).hex()]
+    event_parameters = {"topics": topics}
+    get_logs_spy = mocker.spy(eth_tester_provider.web3.eth, "get_logs")
+
+    logs = [
+        log
+        for log in eth_tester_provider.get_contract_logs(
+            contract_instance.address,
+            abi,
+            stop_block=chain.blocks.height,
+            block_page_size=1,
+            event_parameters=event_parameters,
+        )
+    ]
+
+    assert len(logs) == 3, "Unexpected number of logs"
+    assert get_logs_spy.call_count > 1, "Expected more than one page"
+    for call in get_logs_spy.call_args_list:
+        assert call[0][0]["topics"] == topics
+
+    # The caller's parameters are not modified.
+    assert event_parameters == {"topics": topics}
+
+
 def test_contract_logs_range_over_paging(contract_instance, owner, chain):
     # Create 1 log each in the first 3 blocks.
     for i in range(3):
@@ -346,3 +403,24 @@ def test_solidity_named_tuple(solidity_contract_instance):
 def test_vyper_named_tuple(vyper_contract_instance):
     actual = vyper_contract_instance.getMultipleValues()
     assert actual == (123, 321)
+
+
+def test_method_named_like_metaclass_attribute():
+    # NOTE: ``register`` is defined on ``ABCMeta``, the metaclass of ``ContractInstance``.
+    contract_type = ContractType.parse_obj(
+        {
+            "contractName": "Registrar",
+            "abi": [
+                {
+                    "inputs": [{"internalType": "bytes32", "name": "label", "type": "bytes32"}],
+                    "name": "register",
+                    "outputs": [],
+                    "stateMutability": "nonpayable",
+                    "type": "function",
+                }
+            ],
+        }
+    )
+    contract = ContractInstance(SOLIDITY_CONTRACT_ADDRESS, contract_type)  # type: ignore
+    assert isinstance(contract.register, ContractTransactionHandler)
+    assert repr(contract.register) == "register(bytes32 label)"
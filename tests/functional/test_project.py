@@ -1,3 +1,5 @@
+import json
+import os
 import shutil
 from pathlib import Path
 from typing import Dict
@@ -5,6 +7,19 @@ from typing import Dict
 import pytest
 from ethpm_types.manifest import PackageManifest
 
+from ape.api import ProjectAPI
+from ape.managers.project import ApeProject
+
+INTERFACE_ABI = [
+    {
+        "inputs": [],
+        "name": "myNumber",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    }
+]
+
 
 @pytest.fixture
 def dependencies_config():
@@ -18,6 +33,14 @@ def dependencies_config():
     return {"dependencies": [_create_oz_dependency("3.1.0"), _create_oz_dependency("4.4.2")]}
 
 
+@pytest.fixture
+def interface_project(tmp_path):
+    contracts_folder = tmp_path / "contracts"
+    contracts_folder.mkdir()
+    (contracts_folder / "Interface.json").write_text(json.dumps(INTERFACE_ABI))
+    return ApeProject(path=tmp_path, contracts_folder=contracts_folder)  # type: ignore
+
+
 @pytest.fixture
 def already_downloaded_dependencies(temp_config, config, dependencies_config):
     manifests_directory = Path(__file__).parent / "data" / "manifests"
@@ -42,3 +65,49 @@ def test_two_dependencies_with_same_name(already_downloaded_dependencies, projec
 def test_extract_manifest_type(project):
     manifest = project.project_manager.extract_manifest()
     assert type(manifest) == PackageManifest
+
+
+def test_create_source_dict_translates_newlines(tmp_path):
+    source_path = tmp_path / "Contract.json"
+    source_path.write_bytes(b"line 1\r\nline 2\rline 3\n")
+
+    source_dict = ProjectAPI._create_source_dict([source_path], tmp_path)
+
+    # Content matches a text-mode read of the file.
+    assert source_dict["Contract.json"].content == source_path.read_text()
+    assert source_dict["Contract.json"].content == "line 1\nline 2\nline 3\n"
+
+
+def test_create_manifest_cache_file(interface_project):
+    contracts_folder = interface_project.contracts_folder
+    cache_file = interface_project.manifest_cachefile
+
+    def get_cached_source_ids():
+        return set(json.loads(cache_file.read_text())["sources"])
+
+    interface_project.create_manifest()
+    assert get_cached_source_ids() == {"Interface.json"}
+
+    # Unchanged sources do not re-write the cache file.
+    # NOTE: Reset the modified time to detect any write, regardless of timestamp resolution.
+    os.utime(cache_file, (0, 0))
+    interface_project.create_manifest()
+    assert cache_file.stat().st_mtime == 0
+
+    # Adding a source re-writes the cache file.
+    (contracts_folder / "Other.json").write_text(json.dumps(INTERFACE_ABI))
+    interface_project.create_manifest()
+    assert cache_file.stat().st_mtime != 0
+    assert get_cached_source_ids() == {"Interface.json", "Other.json"}
+
+    # Deleting a source re-writes the cache file.
+    os.utime(cache_file, (0, 0))
+    (contracts_folder / "Other.json").unlink()
+    interface_project.create_manifest()
+    assert cache_file.stat().st_mtime != 0
+    assert get_cached_source_ids() == {"Interface.json"}
+
+    # A missing cache file is re-created.
+    cache_file.unlink()
+    interface_project.create_manifest()
+    assert get_cached_source_ids() == {"Interface.json"}